@@ -46,7 +46,7 @@ class MujocoAgent(parl.Agent):
             reward = layers.data(name='reward', shape=[], dtype='float32')
             next_obs = layers.data(
                 name='next_obs', shape=[self.obs_dim], dtype='float32')
-            terminal = layers.data(name='terminal', shape=[], dtype='bool')
+            terminal = layers.data(name='terminal', shape=[], dtype='float32')
             _, self.critic_cost = self.alg.learn(obs, act, reward, next_obs,
                                                  terminal)
 
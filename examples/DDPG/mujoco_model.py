@@ -19,6 +19,10 @@ from parl import layers
 
 class MujocoModel(parl.Model):
     def __init__(self, act_dim):
+        # lets DDPG build the target network by re-instantiating this
+        # class instead of deep-copying the whole model object graph
+        self._init_kwargs = dict(act_dim=act_dim)
+
         self.actor_model = ActorModel(act_dim)
         self.critic_model = CriticModel()
 
@@ -28,6 +32,12 @@ class MujocoModel(parl.Model):
     def value(self, obs, act):
         return self.critic_model.value(obs, act)
 
+    def obs_encode(self, obs):
+        return self.critic_model.obs_encode(obs)
+
+    def q_head(self, obs_feat, act):
+        return self.critic_model.q_head(obs_feat, act)
+
     def get_actor_params(self):
         return self.actor_model.parameters()
 
@@ -59,8 +69,15 @@ class CriticModel(parl.Model):
         self.fc3 = layers.fc(size=1, act=None)
 
     def value(self, obs, act):
-        hid1 = self.fc1(obs)
-        concat = layers.concat([hid1, act], axis=1)
+        return self.q_head(self.obs_encode(obs), act)
+
+    def obs_encode(self, obs):
+        # the observation trunk; DDPG.learn builds it once and shares it
+        # between the actor loss and the critic loss
+        return self.fc1(obs)
+
+    def q_head(self, obs_feat, act):
+        concat = layers.concat([obs_feat, act], axis=1)
         hid2 = self.fc2(concat)
         Q = self.fc3(hid2)
         Q = layers.squeeze(Q, axes=[1])
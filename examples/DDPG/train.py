@@ -34,7 +34,7 @@ REWARD_SCALE = 0.1
 ENV_SEED = 1
 
 
-def run_train_episode(env, agent, rpm):
+def run_train_episode(env, agent, rpm, batch_holder):
     obs = env.reset()
     total_reward = 0
     steps = 0
@@ -54,10 +54,9 @@ def run_train_episode(env, agent, rpm):
         rpm.append(obs, action, REWARD_SCALE * reward, next_obs, done)
 
         if rpm.size() > MIN_LEARN_SIZE:
-            batch_obs, batch_action, batch_reward, batch_next_obs, batch_terminal = rpm.sample_batch(
-                BATCH_SIZE)
-            agent.learn(batch_obs, batch_action, batch_reward, batch_next_obs,
-                        batch_terminal)
+            # write the sampled batch into pre-allocated arrays
+            rpm.sample_batch_into(*batch_holder)
+            agent.learn(*batch_holder)
 
         obs = next_obs
         total_reward += reward
@@ -101,10 +100,18 @@ def main():
 
     rpm = ReplayMemory(MEMORY_SIZE, obs_dim, act_dim)
 
+    # reusable batch buffers, filled by rpm.sample_batch_into
+    # terminal uses float32 as required by DDPG.learn
+    batch_holder = (np.zeros((BATCH_SIZE, obs_dim), dtype='float32'),
+                    np.zeros((BATCH_SIZE, act_dim), dtype='float32'),
+                    np.zeros((BATCH_SIZE, ), dtype='float32'),
+                    np.zeros((BATCH_SIZE, obs_dim), dtype='float32'),
+                    np.zeros((BATCH_SIZE, ), dtype='float32'))
+
     test_flag = 0
     total_steps = 0
     while total_steps < args.train_total_steps:
-        train_reward, steps = run_train_episode(env, agent, rpm)
+        train_reward, steps = run_train_episode(env, agent, rpm, batch_holder)
         total_steps += steps
         logger.info('Steps: {} Reward: {}'.format(total_steps, train_reward))
 
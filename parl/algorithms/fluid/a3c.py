@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import warnings
-warnings.simplefilter('default')
 
 import paddle.fluid as fluid
 from parl.core.fluid import layers
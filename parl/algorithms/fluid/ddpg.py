@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import warnings
-warnings.simplefilter('default')
 
 from parl.core.fluid import layers
 from copy import deepcopy
@@ -63,7 +62,26 @@ class DDPG(Algorithm):
             self.critic_lr = critic_lr
 
         self.model = model
-        self.target_model = deepcopy(model)
+        self.target_model = self._build_target_model(model)
+
+    def _build_target_model(self, model):
+        """ Build the target network of `model`.
+
+        If the model stores the keyword arguments of its constructor in
+        ``self._init_kwargs``, the target network is built by
+        re-instantiating the model class, which only re-creates the network
+        structure instead of traversing the whole model object graph as
+        ``deepcopy`` does. Models without ``_init_kwargs`` fall back to
+        ``deepcopy``.
+
+        Either way, parameter values of the target network are synchronized
+        by calling ``sync_target(decay=0)`` after the parameters have been
+        initialized (as done in the DDPG example).
+        """
+        init_kwargs = getattr(model, '_init_kwargs', None)
+        if init_kwargs is not None:
+            return type(model)(**init_kwargs)
+        return deepcopy(model)
 
     @deprecated(
         deprecated_in='1.2', removed_in='1.3', replace_function='predict')
@@ -84,32 +102,90 @@ class DDPG(Algorithm):
         """
         return self.learn(obs, action, reward, next_obs, terminal)
 
-    def learn(self, obs, action, reward, next_obs, terminal):
+    def learn(self, obs, action, reward, next_obs, terminal, is_weights=None):
         """ update actor and critic model with DDPG algorithm
+
+        Args:
+            is_weights: optional float32 tensor of per-sample importance
+                sampling weights for prioritized experience replay. When
+                given, the squared TD errors of the critic loss are scaled
+                by these weights before reducing to the mean.
+
+        After this function is called, the per-sample TD errors of the
+        critic are available as ``self.td_error``, which agents can add to
+        their fetch list to update the priorities of the sampled
+        experiences (e.g. in a ``parl.utils.SumTree``).
+
+        Note:
+            ``terminal`` must be a float32 tensor with values in {0.0, 1.0}.
+            Converting the terminal flags once during batch assembly (e.g.
+            with ``terminal.astype('float32')`` in numpy) avoids a cast op
+            over the whole batch inside the learn program on every step.
+
+        Note:
+            If the model implements ``obs_encode(obs)`` and
+            ``q_head(obs_feat, action)`` such that
+            ``value(obs, action) == q_head(obs_encode(obs), action)``, the
+            encoded observation is computed once and shared by the actor
+            loss and the critic loss, which removes a duplicated forward
+            pass of the observation trunk in the learn program.
         """
-        actor_cost = self._actor_learn(obs)
-        critic_cost = self._critic_learn(obs, action, reward, next_obs,
-                                         terminal)
+        obs_feat = None
+        if hasattr(self.model, 'obs_encode') and hasattr(self.model, 'q_head'):
+            obs_feat = self.model.obs_encode(obs)
+        actor_cost = self._actor_learn(obs, obs_feat)
+        critic_cost = self._critic_learn(
+            obs,
+            action,
+            reward,
+            next_obs,
+            terminal,
+            obs_feat=obs_feat,
+            is_weights=is_weights)
         return actor_cost, critic_cost
 
-    def _actor_learn(self, obs):
+    def _value(self, obs, action, obs_feat=None):
+        """ Q value of the critic, reusing the encoded observation if given.
+        """
+        if obs_feat is None:
+            return self.model.value(obs, action)
+        return self.model.q_head(obs_feat, action)
+
+    def _actor_learn(self, obs, obs_feat=None):
         action = self.model.policy(obs)
-        Q = self.model.value(obs, action)
+        Q = self._value(obs, action, obs_feat)
         cost = layers.reduce_mean(-1.0 * Q)
+        # a fresh optimizer per program build; fluid registers its
+        # accumulators per optimizer instance, so reusing one instance
+        # across builds raises an "Accumulator already exists" error
         optimizer = fluid.optimizer.AdamOptimizer(self.actor_lr)
         optimizer.minimize(cost, parameter_list=self.model.get_actor_params())
         return cost
 
-    def _critic_learn(self, obs, action, reward, next_obs, terminal):
+    def _critic_learn(self,
+                      obs,
+                      action,
+                      reward,
+                      next_obs,
+                      terminal,
+                      obs_feat=None,
+                      is_weights=None):
         next_action = self.target_model.policy(next_obs)
         next_Q = self.target_model.value(next_obs, next_action)
 
-        terminal = layers.cast(terminal, dtype='float32')
-        target_Q = reward + (1.0 - terminal) * self.gamma * next_Q
+        # gamma * (1 - terminal) in a single fused scale op, instead of a
+        # subtraction pass followed by a multiplication pass over the batch
+        not_done_gamma = layers.scale(
+            terminal, scale=-self.gamma, bias=self.gamma)
+        target_Q = reward + not_done_gamma * next_Q
         target_Q.stop_gradient = True
 
-        Q = self.model.value(obs, action)
+        Q = self._value(obs, action, obs_feat)
+        # per-sample TD errors, kept for priority updates of replay buffers
+        self.td_error = Q - target_Q
         cost = layers.square_error_cost(Q, target_Q)
+        if is_weights is not None:
+            cost = layers.elementwise_mul(cost, is_weights)
         cost = layers.reduce_mean(cost)
         optimizer = fluid.optimizer.AdamOptimizer(self.critic_lr)
         optimizer.minimize(cost)
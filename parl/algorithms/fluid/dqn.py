@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import warnings
-warnings.simplefilter('default')
 
 import copy
 import paddle.fluid as fluid
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import hashlib
 import paddle.fluid as fluid
 from parl.core.fluid.layers.layer_wrappers import LayerFunc
 from parl.core.fluid.plutils import *
@@ -23,6 +22,21 @@ from parl.utils import machine_info
 __all__ = ['Model']
 
 
+class _SyncProgramCache(object):
+    """Holder for the fluid programs cached by ``sync_weights_to``.
+
+    The cached (program, executor) pairs live behind this plain object
+    instead of directly in a dict attribute of the model, because the
+    recursive parameter walkers (``_get_parameter_names`` and
+    ``_get_parameter_pairs``) descend into dict/list/tuple attributes
+    and would choke on the cached programs; an unknown object type is
+    skipped by both walkers.
+    """
+
+    def __init__(self):
+        self.programs = {}
+
+
 class Model(ModelBase):
     """
     | `alias`: ``parl.Model``
@@ -123,19 +137,19 @@ class Model(ModelBase):
             Before calling ``sync_weights_to``, parameters of the model must have been initialized.
         """
 
-        args_hash_id = hashlib.md5('{}_{}'.format(
-            id(target_model), decay).encode('utf-8')).hexdigest()
-        has_cached = False
+        # programs are cached per (target_model, decay), so synchronizing
+        # with several targets or alternating decay values reuses the
+        # program built for each combination; decay is baked into the
+        # program as a python float, which lets fluid fold the
+        # decay/(1 - decay) scaling into constant-scale ops.
+        args_id = (id(target_model), decay)
         try:
-            if self._cached_id == args_hash_id:
-                has_cached = True
+            cached_programs = self._sync_program_cache.programs
         except AttributeError:
-            has_cached = False
-
-        if not has_cached:
-            # Can not run _cached program, need create a new program
-            self._cached_id = args_hash_id
+            self._sync_program_cache = _SyncProgramCache()
+            cached_programs = self._sync_program_cache.programs
 
+        if args_id not in cached_programs:
             assert not target_model is self, "cannot copy between identical model"
             assert isinstance(target_model, Model)
             assert self.__class__.__name__ == target_model.__class__.__name__, \
@@ -144,9 +158,9 @@ class Model(ModelBase):
 
             param_pairs = self._get_parameter_pairs(self, target_model)
 
-            self._cached_sync_weights_program = fluid.Program()
+            sync_weights_program = fluid.Program()
 
-            with fluid.program_guard(self._cached_sync_weights_program):
+            with fluid.program_guard(sync_weights_program):
                 for (src_var_name, target_var_name) in param_pairs:
                     src_var = fetch_framework_var(src_var_name)
                     target_var = fetch_framework_var(target_var_name)
@@ -157,7 +171,7 @@ class Model(ModelBase):
                 # use fluid.Executor
                 place = fluid.CUDAPlace(0) if machine_info.is_gpu_available(
                 ) else fluid.CPUPlace()
-                self._cached_fluid_executor = fluid.Executor(place)
+                fluid_executor = fluid.Executor(place)
             else:
                 # use fluid.ParallelExecutor
 
@@ -169,17 +183,20 @@ class Model(ModelBase):
                 build_strategy.remove_unnecessary_lock = True
 
                 with fluid.scope_guard(fluid.global_scope().new_scope()):
-                    self._cached_fluid_executor = fluid.ParallelExecutor(
+                    fluid_executor = fluid.ParallelExecutor(
                         use_cuda=machine_info.is_gpu_available(),
-                        main_program=self._cached_sync_weights_program,
+                        main_program=sync_weights_program,
                         share_vars_from=share_vars_parallel_executor,
                         exec_strategy=exec_strategy,
                         build_strategy=build_strategy,
                     )
+            cached_programs[args_id] = (sync_weights_program, fluid_executor)
+
+        sync_weights_program, fluid_executor = cached_programs[args_id]
         if share_vars_parallel_executor is None:
-            self._cached_fluid_executor.run(self._cached_sync_weights_program)
+            fluid_executor.run(sync_weights_program)
         else:
-            self._cached_fluid_executor.run(fetch_list=[])
+            fluid_executor.run(fetch_list=[])
 
     @property
     @deprecated(
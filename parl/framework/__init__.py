@@ -13,8 +13,6 @@
 # limitations under the License.
 import warnings
 
-warnings.simplefilter('default')
-
 warnings.warn(
     "import way `import parl.framework` is deprecated since version 1.2 and will be removed in version 1.3.",
     DeprecationWarning,
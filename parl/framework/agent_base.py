@@ -14,8 +14,6 @@
 
 import warnings
 
-warnings.simplefilter('default')
-
 warnings.warn(
     "module `parl.framework.agent_base.Agent` is deprecated since version 1.2 and will be removed in version 1.3, please use `parl.Agent` instead.",
     DeprecationWarning,
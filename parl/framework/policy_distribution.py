@@ -14,8 +14,6 @@
 
 import warnings
 
-warnings.simplefilter('default')
-
 warnings.warn(
     "module `parl.framework.policy_distribution` is deprecated since version 1.2 and will be removed in version 1.3, please use `parl.policy_distribution` instead.",
     DeprecationWarning,
@@ -14,8 +14,6 @@
 
 import warnings
 
-warnings.simplefilter('default')
-
 warnings.warn(
     "import way `import parl.layers` is deprecated since version 1.2 and will be removed in version 1.3, please use `from parl import layers` or `import parl; parl.layers` instead.",
     DeprecationWarning,
@@ -12,8 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import cloudpickle
 import os
+import pickle
 import threading
 import zmq
 from parl.utils import to_str, to_byte, get_ip_address, logger
@@ -55,7 +55,7 @@ class Client(object):
         then be sent to the job.
 
         Returns:
-            A cloudpickled dictionary containing the python code in current
+            A pickled dictionary containing the python code in current
             working directory.
         """
         pyfiles = dict()
@@ -64,7 +64,9 @@ class Client(object):
                 with open(file, 'rb') as code_file:
                     code = code_file.read()
                     pyfiles[file] = code
-        return cloudpickle.dumps(pyfiles)
+        # a {filename: bytes} dict needs no cloudpickle; the highest pickle
+        # protocol serializes the file contents without a text encoding pass
+        return pickle.dumps(pyfiles, protocol=pickle.HIGHEST_PROTOCOL)
 
     def _create_sockets(self, master_address):
         """ Each client has 1 sockets as start:
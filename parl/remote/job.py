@@ -25,11 +25,20 @@ import time
 import traceback
 import zmq
 from parl.utils import to_str, to_byte, get_ip_address, logger
-from parl.utils.communication import loads_argument, loads_return,\
-    dumps_argument, dumps_return
+from parl.utils.communication import loads_argument_frames,\
+    dumps_return_frames
 from parl.remote import remote_constants
 from parl.utils.exceptions import SerializeError, DeserializeError
 from parl.remote.message import InitializedJob
+try:
+    from parl.remote.memory_loader import DictFinder
+except ImportError:
+    # python2 has no importlib.abc; received files are written to disk
+    DictFinder = None
+
+# The heartbeat reply never changes, so one zmq.Frame is built once and
+# reused for every reply instead of wrapping the tag bytes per send.
+HEARTBEAT_FRAME = zmq.Frame(remote_constants.HEARTBEAT_TAG)
 
 
 class Job(object):
@@ -62,7 +71,9 @@ class Job(object):
 
         """
 
-        self.ctx = zmq.Context()
+        # 2 IO threads keep heartbeat replies responsive while a large
+        # CALL return is being transferred on the reply_socket
+        self.ctx = zmq.Context(io_threads=2)
 
         # create the reply_socket
         self.reply_socket = self.ctx.socket(zmq.REP)
@@ -75,40 +86,37 @@ class Job(object):
         self.job_socket = self.ctx.socket(zmq.REQ)
         self.job_socket.connect("tcp://{}".format(self.worker_address))
 
-        # a thread that reply ping signals from the client
-        ping_heartbeat_socket, ping_heartbeat_address = self._create_heartbeat_server(
-            timeout=False)
-        ping_thread = threading.Thread(
-            target=self._reply_ping, args=(ping_heartbeat_socket, ))
-        ping_thread.setDaemon(True)
-        ping_thread.start()
-        self.ping_heartbeat_address = ping_heartbeat_address
-
-        # a thread that reply heartbeat signals from the worker
-        worker_heartbeat_socket, worker_heartbeat_address = self._create_heartbeat_server(
-        )
-        worker_thread = threading.Thread(
-            target=self._reply_worker_heartbeat,
-            args=(worker_heartbeat_socket, ))
-        worker_thread.setDaemon(True)
-        worker_thread.start()
-
-        # a thread that reply heartbeat signals from the client
-        client_heartbeat_socket, client_heartbeat_address = self._create_heartbeat_server(
-        )
-        self.client_thread = threading.Thread(
-            target=self._reply_client_heartbeat,
-            args=(client_heartbeat_socket, ))
-        self.client_thread.setDaemon(True)
+        # sockets replying ping/heartbeat signals from the client and the
+        # worker; all of them are serviced by one poller thread
+        self.ping_heartbeat_socket, self.ping_heartbeat_address = \
+            self._create_heartbeat_server()
+        self.worker_heartbeat_socket, self.worker_heartbeat_address = \
+            self._create_heartbeat_server()
+        self.client_heartbeat_socket, self.client_heartbeat_address = \
+            self._create_heartbeat_server()
+
+        self.worker_is_alive = True
+        # the client heartbeat is only watched after a client has connected
+        # (see `_start_client_heartbeat`)
+        self.client_is_connected = False
+        self.client_is_alive = False
+
+        heartbeat_thread = threading.Thread(target=self._reply_heartbeats)
+        heartbeat_thread.setDaemon(True)
+        heartbeat_thread.start()
 
         # sends job information to the worker
         initialized_job = InitializedJob(
-            self.job_address, worker_heartbeat_address,
-            client_heartbeat_address, self.ping_heartbeat_address, None,
+            self.job_address, self.worker_heartbeat_address,
+            self.client_heartbeat_address, self.ping_heartbeat_address, None,
             os.getpid())
-        self.job_socket.send_multipart(
-            [remote_constants.NORMAL_TAG,
-             cloudpickle.dumps(initialized_job)])
+        # InitializedJob is a plain message object; plain pickle with the
+        # highest protocol is enough (and cheaper than cloudpickle), and the
+        # worker side loads it with cloudpickle.loads, which is pickle.loads.
+        self.job_socket.send_multipart([
+            remote_constants.NORMAL_TAG,
+            pickle.dumps(initialized_job, protocol=pickle.HIGHEST_PROTOCOL)
+        ])
         message = self.job_socket.recv_multipart()
 
         assert message[0] == remote_constants.NORMAL_TAG
@@ -119,81 +127,123 @@ class Job(object):
             zmq.RCVTIMEO, remote_constants.HEARTBEAT_TIMEOUT_S * 1000)
         self.kill_job_socket.connect("tcp://{}".format(kill_job_address))
 
-    def _reply_ping(self, socket):
-        """Create a socket server that reply the ping signal from client.
-        This signal is used to make sure that the job is still alive.
-        """
-        while self.job_is_alive:
-            message = socket.recv_multipart()
-            socket.send_multipart([remote_constants.HEARTBEAT_TAG])
-        socket.close(0)
+    def _create_heartbeat_server(self):
+        """Create a socket server replying heartbeat signals.
 
-    def _create_heartbeat_server(self, timeout=True):
-        """Create a socket server that will raises timeout exception.
+        Timeouts of the heartbeat sockets are emulated with deadlines in
+        `_reply_heartbeats` instead of `zmq.RCVTIMEO`, as the sockets are
+        serviced by a poller instead of blocking receives.
         """
         heartbeat_socket = self.ctx.socket(zmq.REP)
-        if timeout:
-            heartbeat_socket.setsockopt(
-                zmq.RCVTIMEO, remote_constants.HEARTBEAT_RCVTIMEO_S * 1000)
         heartbeat_socket.linger = 0
+        # heartbeats are periodic single messages; a high-water mark of 1
+        # prevents stale signals from queueing up on a busy job, and TCP
+        # keepalive detects silently dropped peers
+        heartbeat_socket.setsockopt(zmq.SNDHWM, 1)
+        heartbeat_socket.setsockopt(zmq.RCVHWM, 1)
+        heartbeat_socket.setsockopt(zmq.TCP_KEEPALIVE, 1)
         heartbeat_port = heartbeat_socket.bind_to_random_port(addr="tcp://*")
         heartbeat_address = "{}:{}".format(self.job_ip, heartbeat_port)
         return heartbeat_socket, heartbeat_address
 
-    def _reply_client_heartbeat(self, socket):
-        """Create a socket that replies heartbeat signals from the client.
-        If the job losts connection with the client, it will exit too.
+    def _start_client_heartbeat(self):
+        """Start watching heartbeat signals from the client.
+
+        Called once a client has connected; from then on, losing the
+        client's heartbeat terminates the job.
         """
+        self._client_heartbeat_deadline = time.time() + \
+            remote_constants.HEARTBEAT_RCVTIMEO_S
         self.client_is_alive = True
-        while self.client_is_alive:
-            try:
-                message = socket.recv_multipart()
-                socket.send_multipart([remote_constants.HEARTBEAT_TAG])
+        self.client_is_connected = True
 
-            except zmq.error.Again as e:
-                logger.warning(
-                    "[Job] Cannot connect to the client. This job will exit and inform the worker."
-                )
-                self.client_is_alive = False
-        socket.close(0)
-        with self.lock:
-            self.kill_job_socket.send_multipart(
-                [remote_constants.KILLJOB_TAG,
-                 to_byte(self.job_address)])
-            _ = self.kill_job_socket.recv_multipart()
-        logger.warning("[Job]lost connection with the client, will exit")
-        os._exit(1)
+    def _reply_heartbeats(self):
+        """Reply the ping signals from the client and the heartbeat signals
+        from the worker and the client with a single poller loop.
 
-    def _reply_worker_heartbeat(self, socket):
-        """create a socket that replies heartbeat signals from the worker.
-        If the worker has exited, the job will exit automatically.
+        Running one thread over three REP sockets replaces the former
+        one-blocking-thread-per-socket scheme. If the job loses connection
+        with the worker or the client, it will exit, as before.
         """
+        poller = zmq.Poller()
+        poller.register(self.ping_heartbeat_socket, zmq.POLLIN)
+        poller.register(self.worker_heartbeat_socket, zmq.POLLIN)
+        poller.register(self.client_heartbeat_socket, zmq.POLLIN)
 
-        self.worker_is_alive = True
-        # a flag to decide when to exit heartbeat loop
+        rcvtimeo_s = remote_constants.HEARTBEAT_RCVTIMEO_S
+        worker_heartbeat_deadline = time.time() + rcvtimeo_s
+
+        # this thread is the only watchdog of the job now; whatever
+        # happens inside the loop, the process must exit when it ends
+        try:
+            self._heartbeat_loop(poller, worker_heartbeat_deadline, rcvtimeo_s)
+        finally:
+            self.ping_heartbeat_socket.close(0)
+            self.worker_heartbeat_socket.close(0)
+            self.client_heartbeat_socket.close(0)
+            os._exit(1)
+
+    def _heartbeat_loop(self, poller, worker_heartbeat_deadline, rcvtimeo_s):
         while self.worker_is_alive and self.job_is_alive:
-            try:
-                message = socket.recv_multipart()
-                socket.send_multipart([remote_constants.HEARTBEAT_TAG])
+            events = dict(poller.poll(1000))
+            now = time.time()
+
+            if self.ping_heartbeat_socket in events:
+                self.ping_heartbeat_socket.recv_multipart()
+                self.ping_heartbeat_socket.send(HEARTBEAT_FRAME, copy=False)
 
-            except zmq.error.Again as e:
+            if self.worker_heartbeat_socket in events:
+                self.worker_heartbeat_socket.recv_multipart()
+                self.worker_heartbeat_socket.send(HEARTBEAT_FRAME, copy=False)
+                worker_heartbeat_deadline = now + rcvtimeo_s
+
+            if self.client_heartbeat_socket in events:
+                self.client_heartbeat_socket.recv_multipart()
+                self.client_heartbeat_socket.send(HEARTBEAT_FRAME, copy=False)
+                self._client_heartbeat_deadline = now + rcvtimeo_s
+
+            if now > worker_heartbeat_deadline:
                 logger.warning("[Job] Cannot connect to the worker{}. ".format(
                     self.worker_address) + "Job will quit.")
                 self.worker_is_alive = False
                 self.job_is_alive = False
-        socket.close(0)
-        os._exit(1)
+                break
+
+            if self.client_is_connected:
+                if self.client_is_alive and \
+                        now > self._client_heartbeat_deadline:
+                    logger.warning(
+                        "[Job] Cannot connect to the client. This job will exit and inform the worker."
+                    )
+                    self.client_is_alive = False
+                if not self.client_is_alive:
+                    try:
+                        with self.lock:
+                            self.kill_job_socket.send_multipart([
+                                remote_constants.KILLJOB_TAG,
+                                to_byte(self.job_address)
+                            ])
+                            _ = self.kill_job_socket.recv_multipart()
+                    except zmq.error.Again:
+                        # the worker is unreachable as well; exit anyway
+                        pass
+                    logger.warning(
+                        "[Job]lost connection with the client, will exit")
+                    break
 
     def wait_for_files(self):
         """Wait for python files from remote object.
 
         When a remote object receives the allocated job address, it will send
-        the python files to the job. Later, the job will save these files to a
-        temporary directory and add the temporary diretory to Python's working
-        directory.
+        the python files to the job. The job makes these files importable
+        directly from memory by installing a meta path finder, avoiding
+        per-file disk writes and the stat calls of path-based importing.
+        On python2, the files are saved to a temporary directory instead and
+        the directory is added to Python's working directory.
 
         Returns:
-            A temporary directory containing the python files.
+            A temporary directory containing the python files, or None when
+            the files are served from memory.
         """
 
         while True:
@@ -201,12 +251,21 @@ class Job(object):
             tag = message[0]
             if tag == remote_constants.SEND_FILE_TAG:
                 pyfiles = pickle.loads(message[1])
-                envdir = tempfile.mkdtemp()
-                for file in pyfiles:
-                    code = pyfiles[file]
-                    file = os.path.join(envdir, file)
-                    with open(file, 'wb') as code_file:
-                        code_file.write(code)
+                if DictFinder is not None:
+                    # appending gives the received files the lowest import
+                    # precedence, the same as sys.path.append(envdir) did;
+                    # they must not shadow stdlib or installed packages
+                    sys.meta_path.append(DictFinder(pyfiles))
+                    envdir = None
+                else:
+                    envdir = tempfile.mkdtemp()
+                    for file in pyfiles:
+                        code = pyfiles[file]
+                        file = os.path.join(envdir, file)
+                        # unbuffered mode writes each file with a single
+                        # syscall and no intermediate buffer copy
+                        with open(file, 'wb', 0) as code_file:
+                            code_file.write(code)
                 self.reply_socket.send_multipart([remote_constants.NORMAL_TAG])
                 return envdir
             else:
@@ -261,8 +320,9 @@ class Job(object):
         """
         # receive source code from the actor and append them to the environment variables.
         envdir = self.wait_for_files()
-        sys.path.append(envdir)
-        self.client_thread.start()
+        if envdir is not None:
+            sys.path.append(envdir)
+        self._start_client_heartbeat()
 
         try:
             obj = self.wait_for_connection()
@@ -290,23 +350,43 @@ class Job(object):
            remote object.
         2. When the remote object is deleted, the job will quit and release
            related computation resources.
+
+        Note:
+            The reply_socket is a REP socket talking to a single REQ peer,
+            so there is never more than one request in flight; requests
+            cannot be drained and replied in batches without changing the
+            wire protocol of all clients.
         """
 
+        # bind the socket methods once outside the RPC loop
+        recv_multipart = self.reply_socket.recv_multipart
+        send_multipart = self.reply_socket.send_multipart
+
+        # cache of bound methods of the remote object; getattr per call
+        # pays an attribute lookup plus a method-descriptor bind
+        method_cache = {}
+
         while self.job_is_alive and self.client_is_alive:
-            message = self.reply_socket.recv_multipart()
+            message = recv_multipart()
 
             tag = message[0]
 
             if tag == remote_constants.CALL_TAG:
                 try:
                     function_name = to_str(message[1])
-                    data = message[2]
-                    args, kwargs = loads_argument(data)
-                    ret = getattr(obj, function_name)(*args, **kwargs)
-                    ret = dumps_return(ret)
-
-                    self.reply_socket.send_multipart(
-                        [remote_constants.NORMAL_TAG, ret])
+                    args, kwargs = loads_argument_frames(message[2:])
+                    method = method_cache.get(function_name)
+                    if method is None:
+                        method = getattr(obj, function_name)
+                        method_cache[function_name] = method
+                    ret = method(*args, **kwargs)
+                    ret_frames = dumps_return_frames(ret)
+
+                    # copy=False lets pyzmq send large return buffers
+                    # (e.g. numpy arrays serialized by pyarrow) without an
+                    # extra memcpy; small frames are still copied as usual.
+                    send_multipart(
+                        [remote_constants.NORMAL_TAG] + ret_frames, copy=False)
 
                 except Exception as e:
                     # reset the job
@@ -316,21 +396,21 @@ class Job(object):
                     logger.error(error_str)
 
                     if type(e) == AttributeError:
-                        self.reply_socket.send_multipart([
+                        send_multipart([
                             remote_constants.ATTRIBUTE_EXCEPTION_TAG,
                             to_byte(error_str)
                         ])
                         raise AttributeError
 
                     elif type(e) == SerializeError:
-                        self.reply_socket.send_multipart([
+                        send_multipart([
                             remote_constants.SERIALIZE_EXCEPTION_TAG,
                             to_byte(error_str)
                         ])
                         raise SerializeError
 
                     elif type(e) == DeserializeError:
-                        self.reply_socket.send_multipart([
+                        send_multipart([
                             remote_constants.DESERIALIZE_EXCEPTION_TAG,
                             to_byte(error_str)
                         ])
@@ -339,7 +419,7 @@ class Job(object):
                     else:
                         traceback_str = str(traceback.format_exc())
                         logger.error("traceback:\n{}".format(traceback_str))
-                        self.reply_socket.send_multipart([
+                        send_multipart([
                             remote_constants.EXCEPTION_TAG,
                             to_byte(error_str + "\ntraceback:\n" +
                                     traceback_str)
@@ -348,7 +428,7 @@ class Job(object):
 
             # receive DELETE_TAG from actor, and stop replying worker heartbeat
             elif tag == remote_constants.KILLJOB_TAG:
-                self.reply_socket.send_multipart([remote_constants.NORMAL_TAG])
+                send_multipart([remote_constants.NORMAL_TAG])
                 self.client_is_alive = False
                 logger.warning(
                     "An actor exits and this job {} will exit.".format(
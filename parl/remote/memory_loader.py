@@ -0,0 +1,78 @@
+#   Copyright (c) 2019 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# importlib.abc is python3 only; importers of this module are expected to
+# fall back to writing the files to disk when it is unavailable.
+from importlib.abc import Loader, MetaPathFinder
+from importlib.util import spec_from_loader
+
+__all__ = ['DictFinder']
+
+
+class DictLoader(Loader):
+    """Load a module whose source code is held in memory."""
+
+    def __init__(self, filename, code):
+        self.filename = filename
+        self.code = code
+
+    def create_module(self, spec):
+        # use the default module creation
+        return None
+
+    def get_filename(self, fullname):
+        return self.filename
+
+    def exec_module(self, module):
+        # modules loaded from disk always carry `__file__`; keep the
+        # attribute so user code like os.path.dirname(__file__) works
+        module.__file__ = self.filename
+        exec(compile(self.code, self.filename, 'exec'), module.__dict__)
+
+
+class DictFinder(MetaPathFinder):
+    """Resolve imports from a ``{filename: source_code}`` dictionary.
+
+    The job receives the python files of the client as a dictionary of
+    in-memory source code. Installing a ``DictFinder`` on ``sys.meta_path``
+    makes these files importable without writing them to a temporary
+    directory first, so a job starts without per-file disk writes, the
+    stat calls of path-based importing, or ``__pycache__`` side effects.
+
+    Example:
+
+    .. code-block:: python
+
+        sys.meta_path.append(DictFinder({'actor.py': b'x = 1'}))
+        import actor
+    """
+
+    def __init__(self, pyfiles):
+        """
+        Args:
+            pyfiles (dict): a dictionary mapping file names (e.g.
+                            'actor.py') to their source code in bytes.
+        """
+        self.sources = dict()
+        for filename, code in pyfiles.items():
+            if filename.endswith('.py'):
+                module_name = filename[:-len('.py')]
+                self.sources[module_name] = (filename, code)
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname in self.sources:
+            filename, code = self.sources[fullname]
+            return spec_from_loader(
+                fullname, DictLoader(filename, code), origin=filename)
+        return None
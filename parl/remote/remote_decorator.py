@@ -20,8 +20,8 @@ import zmq
 import numpy as np
 
 from parl.utils import get_ip_address, logger, to_str, to_byte
-from parl.utils.communication import loads_argument, loads_return,\
-    dumps_argument, dumps_return
+from parl.utils.communication import loads_return_frames,\
+    dumps_argument_frames
 from parl.remote import remote_constants
 from parl.remote.exceptions import RemoteError, RemoteAttributeError,\
     RemoteDeserializeError, RemoteSerializeError, ResourceError
@@ -155,17 +155,21 @@ def remote_class(cls):
                     raise RemoteError(
                         attr, "This actor losts connection with the job.")
                 self.internal_lock.acquire()
-                data = dumps_argument(*args, **kwargs)
+                data_frames = dumps_argument_frames(*args, **kwargs)
 
+                # copy=False lets pyzmq send large argument buffers (e.g.
+                # numpy batches serialized by pyarrow) without an extra
+                # memcpy; small frames are still copied as usual.
                 self.job_socket.send_multipart(
                     [remote_constants.CALL_TAG,
-                     to_byte(attr), data])
+                     to_byte(attr)] + data_frames,
+                    copy=False)
 
                 message = self.job_socket.recv_multipart()
                 tag = message[0]
 
                 if tag == remote_constants.NORMAL_TAG:
-                    ret = loads_return(message[1])
+                    ret = loads_return_frames(message[1:])
 
                 elif tag == remote_constants.EXCEPTION_TAG:
                     error_str = to_str(message[1])
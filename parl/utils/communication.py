@@ -13,10 +13,15 @@
 # limitations under the License.
 
 import cloudpickle
+import pickle
 import pyarrow
 from parl.utils import SerializeError, DeserializeError
 
-__all__ = ['dumps_argument', 'loads_argument', 'dumps_return', 'loads_return']
+__all__ = [
+    'dumps_argument', 'loads_argument', 'dumps_return', 'loads_return',
+    'dumps_argument_frames', 'loads_argument_frames', 'dumps_return_frames',
+    'loads_return_frames'
+]
 
 
 # Reference: https://github.com/apache/arrow/blob/f88474c84e7f02e226eb4cc32afef5e2bbc6e5b4/python/pyarrow/tests/test_serialization.py#L658-L682
@@ -42,6 +47,37 @@ context.register_type(
     custom_serializer=_serialize_serializable,
     custom_deserializer=_deserialize_serializable)
 
+# Warm up the serialization machinery once at import time. On
+# pyarrow 0.13, `pyarrow.deserialize_components` crashes the process
+# when it is the very first serialization operation performed, which is
+# exactly the situation of a job process receiving its first CALL.
+pyarrow.serialize(None, context=context)
+
+
+def _serialize_to_frames(data):
+    """Serialize data into a list of message frames.
+
+    Unlike ``pyarrow.serialize(...).to_buffer()``, the serialized
+    components are not concatenated into one contiguous buffer, which
+    avoids a full copy of every payload buffer; the frames can be sent
+    as-is with ``zmq.Socket.send_multipart``.
+    """
+    components = pyarrow.serialize(data, context=context).to_components()
+    buffers = components.pop('data')
+    header = pickle.dumps(components, protocol=pickle.HIGHEST_PROTOCOL)
+    return [header] + buffers
+
+
+def _deserialize_from_frames(frames):
+    """Restore data serialized by `_serialize_to_frames`.
+
+    The payload frames are wrapped with ``pyarrow.py_buffer``, so no
+    copy is made while reassembling the components.
+    """
+    components = pickle.loads(bytes(frames[0]))
+    components['data'] = [pyarrow.py_buffer(frame) for frame in frames[1:]]
+    return pyarrow.deserialize_components(components, context=context)
+
 
 def dumps_argument(*args, **kwargs):
     """
@@ -81,6 +117,47 @@ def loads_argument(data):
     return ret
 
 
+def dumps_argument_frames(*args, **kwargs):
+    """
+    Serialize arguments passed to a function into message frames.
+
+    The frame-based variant of `dumps_argument`: large payload buffers
+    (e.g. numpy arrays) become separate frames instead of being copied
+    into one contiguous buffer.
+
+    args:
+        *args, **kwargs are general a commonly used representation of arguments in python.
+
+    Returns:
+        A list of buffers to be sent as one multipart message.
+    """
+    try:
+        frames = _serialize_to_frames([args, kwargs])
+    except Exception as e:
+        raise SerializeError(e)
+
+    return frames
+
+
+def loads_argument_frames(frames):
+    """
+    Restore message frames to their initial data formats.
+
+    Args:
+        frames: the output of `dumps_argument_frames`.
+
+    Returns:
+        deserialized arguments [args, kwargs]
+        like the input of `dumps_argument_frames`, args is a tuple, and kwargs is a dict
+    """
+    try:
+        ret = _deserialize_from_frames(frames)
+    except Exception as e:
+        raise DeserializeError(e)
+
+    return ret
+
+
 def dumps_return(data):
     """
     Serialize the return data of a function.
@@ -115,3 +192,43 @@ def loads_return(data):
         raise DeserializeError(e)
 
     return ret
+
+
+def dumps_return_frames(data):
+    """
+    Serialize the return data of a function into message frames.
+
+    The frame-based variant of `dumps_return`: large payload buffers
+    (e.g. numpy arrays) become separate frames instead of being copied
+    into one contiguous buffer.
+
+    Args:
+        data: the output of a function.
+
+    Returns:
+        A list of buffers to be sent as one multipart message.
+    """
+    try:
+        frames = _serialize_to_frames(data)
+    except Exception as e:
+        raise SerializeError(e)
+
+    return frames
+
+
+def loads_return_frames(frames):
+    """
+    Deserialize the frames generated by `dumps_return_frames`.
+
+    Args:
+        frames: the output of `dumps_return_frames`
+
+    Returns:
+        deserialized data
+    """
+    try:
+        ret = _deserialize_from_frames(frames)
+    except Exception as e:
+        raise DeserializeError(e)
+
+    return ret
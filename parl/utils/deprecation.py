@@ -22,7 +22,11 @@ import functools
 import textwrap
 import warnings
 
-warnings.simplefilter('default')
+# Deprecation warnings are hidden by the default filters of python.
+# Unhide this single category here, once, instead of calling
+# `warnings.simplefilter('default')` in every module that may warn,
+# which resets the filters of all other warning categories as well.
+warnings.filterwarnings('default', category=DeprecationWarning)
 
 
 class CustomDeprecationWarning(DeprecationWarning):
@@ -33,11 +33,15 @@ class ReplayMemory(object):
         self._curr_size = 0
         self._curr_pos = 0
 
-    def sample_batch(self, batch_size):
+    def _sample_batch_idx(self, batch_size):
         # index mapping to avoid sampling saving example
         batch_idx = np.random.randint(
             self._curr_size - 300 - 1, size=batch_size)
         batch_idx = (self._curr_pos + 300 + batch_idx) % self._curr_size
+        return batch_idx
+
+    def sample_batch(self, batch_size):
+        batch_idx = self._sample_batch_idx(batch_size)
 
         obs = self.obs[batch_idx]
         reward = self.reward[batch_idx]
@@ -46,6 +50,31 @@ class ReplayMemory(object):
         terminal = self.terminal[batch_idx]
         return obs, action, reward, next_obs, terminal
 
+    def sample_batch_into(self, obs, action, reward, next_obs, terminal):
+        """Sample a batch and write it into pre-allocated arrays.
+
+        Unlike ``sample_batch``, no batch arrays are allocated per call; the
+        sampled rows are gathered with ``np.take`` directly into the given
+        buffers, so batch assembly in the training loop stays vectorized and
+        allocation-free.
+
+        Args:
+            obs(np.float32 np.ndarray): shape (batch_size, obs_dim)
+            action(np.float32 np.ndarray): shape (batch_size, act_dim)
+            reward(np.float32 np.ndarray): shape (batch_size,)
+            next_obs(np.float32 np.ndarray): shape (batch_size, obs_dim)
+            terminal(np.ndarray): shape (batch_size,). May use a dtype
+                different from the internal bool storage (e.g. float32);
+                values are converted while gathering.
+        """
+        batch_idx = self._sample_batch_idx(obs.shape[0])
+
+        np.take(self.obs, batch_idx, axis=0, out=obs)
+        np.take(self.action, batch_idx, axis=0, out=action)
+        np.take(self.reward, batch_idx, axis=0, out=reward)
+        np.take(self.next_obs, batch_idx, axis=0, out=next_obs)
+        terminal[...] = self.terminal[batch_idx]
+
     def append(self, obs, act, reward, next_obs, terminal):
         if self._curr_size < self.max_size:
             self._curr_size += 1
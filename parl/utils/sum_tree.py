@@ -0,0 +1,112 @@
+#   Copyright (c) 2019 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+__all__ = ['SumTree']
+
+
+class SumTree(object):
+    """K-ary sum tree for sampling proportionally to stored priorities.
+
+    The typical use case is prioritized experience replay: leaf i holds the
+    priority of experience i, sampling draws a uniform number in
+    [0, total) and descends to the matching leaf.
+
+    The tree is laid out breadth-first in a single flat numpy array, so the
+    K children of a node are contiguous in memory and a whole sibling group
+    is scanned with one vectorized pass. With the default K=16 a descent
+    touches log_16(capacity) sibling groups, which is both fewer levels and
+    more cache-friendly than a binary tree.
+
+    Example:
+
+    .. code-block:: python
+
+        tree = SumTree(capacity=int(1e6))
+        tree.update(0, 1.5)                  # priority of experience 0
+        leaf = tree.retrieve(np.random.uniform(0, tree.total()))
+    """
+
+    def __init__(self, capacity, branch_factor=16):
+        """
+        Args:
+            capacity (int): maximum number of leaves (experiences).
+            branch_factor (int): number of children per node (K).
+        """
+        assert capacity > 0
+        assert branch_factor >= 2
+        self.capacity = capacity
+        self.branch_factor = branch_factor
+
+        # number of internal nodes of a complete K-ary tree whose last
+        # level has at least `capacity` nodes
+        level_size = 1
+        self._leaf_start = 0
+        while level_size < capacity:
+            self._leaf_start += level_size
+            level_size *= branch_factor
+        self._tree = np.zeros((self._leaf_start + level_size, ),
+                              dtype='float64')
+
+    def total(self):
+        """Return the sum of all leaf values."""
+        return self._tree[0]
+
+    def get_leaf_value(self, leaf_idx):
+        """Return the value stored at leaf `leaf_idx`."""
+        assert 0 <= leaf_idx < self.capacity
+        return self._tree[self._leaf_start + leaf_idx]
+
+    def update(self, leaf_idx, value):
+        """Set the value of leaf `leaf_idx` and update its ancestors.
+
+        Args:
+            leaf_idx (int): index of the leaf, in [0, capacity).
+            value (float): new value (e.g. priority) of the leaf, >= 0.
+        """
+        assert 0 <= leaf_idx < self.capacity
+        assert value >= 0
+        node = self._leaf_start + leaf_idx
+        delta = value - self._tree[node]
+        self._tree[node] = value
+        while node > 0:
+            node = (node - 1) // self.branch_factor
+            self._tree[node] += delta
+
+    def retrieve(self, prefixsum):
+        """Find the leaf whose prefix-sum interval contains `prefixsum`.
+
+        Returns the smallest leaf_idx such that the sum of leaf values in
+        [0, leaf_idx] is strictly greater than `prefixsum`.
+
+        Args:
+            prefixsum (float): a number in [0, total()).
+
+        Returns:
+            leaf_idx (int): index of the sampled leaf.
+        """
+        assert 0 <= prefixsum <= self.total()
+        node = 0
+        while node < self._leaf_start:
+            first_child = node * self.branch_factor + 1
+            children_sum = np.cumsum(
+                self._tree[first_child:first_child + self.branch_factor])
+            child = int(np.searchsorted(children_sum, prefixsum, side='right'))
+            # guard against floating point drift at the right boundary
+            child = min(child, self.branch_factor - 1)
+            if child > 0:
+                prefixsum -= children_sum[child - 1]
+            node = first_child + child
+        return min(node - self._leaf_start, self.capacity - 1)
@@ -13,11 +13,17 @@
 # limitations under the License.
 
 import numpy as np
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
 import time
 import threading
 import unittest
 from parl.utils.communication import dumps_return, loads_return, \
-        dumps_argument, loads_argument
+        dumps_argument, loads_argument, dumps_return_frames, \
+        loads_return_frames, dumps_argument_frames, loads_argument_frames
 
 
 class TestCommunication(unittest.TestCase):
@@ -85,6 +91,58 @@ class TestCommunication(unittest.TestCase):
 
         assert deserialize_result[0][0].a == 3
 
+    def test_dumps_loads_return_frames(self):
+        data = {
+            'arrays': [np.random.RandomState(0).randn(100, 300)] * 5,
+            'scalars': list(range(100))
+        }
+        frames = dumps_return_frames(data)
+        # frames must survive a bytes round-trip, as zmq delivers bytes
+        frames = [bytes(frame) for frame in frames]
+        deserialize_result = loads_return_frames(frames)
+
+        assert deserialize_result['scalars'] == data['scalars']
+        for (array, expected) in zip(deserialize_result['arrays'],
+                                     data['arrays']):
+            assert np.array_equal(array, expected)
+
+    def test_dumps_loads_argument_frames(self):
+        array = np.random.RandomState(0).randn(100, 300)
+        frames = dumps_argument_frames(array, n=3)
+        frames = [bytes(frame) for frame in frames]
+        args, kwargs = loads_argument_frames(frames)
+
+        assert np.array_equal(args[0], array)
+        assert kwargs == {'n': 3}
+
+    def test_loads_return_frames_in_fresh_process(self):
+        # frames are deserialized by another process in practice, and
+        # deserializing must work as the first serialization operation
+        # of that process; an in-process round trip cannot catch this.
+        data = [np.random.RandomState(0).randn(100, 300), list(range(100))]
+        frames = [bytes(frame) for frame in dumps_return_frames(data)]
+
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            pickle.dump(frames, f)
+            frames_file = f.name
+
+        script = '\n'.join([
+            "import pickle, sys",
+            "import numpy as np",
+            "from parl.utils.communication import loads_return_frames",
+            "with open(sys.argv[1], 'rb') as f:",
+            "    frames = pickle.load(f)",
+            "data = loads_return_frames(frames)",
+            "assert data[1] == list(range(100))",
+            "expected = np.random.RandomState(0).randn(100, 300)",
+            "assert np.array_equal(data[0], expected)",
+        ])
+        try:
+            ret = subprocess.call([sys.executable, '-c', script, frames_file])
+        finally:
+            os.remove(frames_file)
+        assert ret == 0
+
     def test_dumps_loads_return_with_multi_thread(self):
         class A(object):
             def __init__(self, a):
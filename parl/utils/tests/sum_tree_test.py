@@ -0,0 +1,72 @@
+#   Copyright (c) 2019 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import unittest
+from parl.utils import SumTree
+
+
+class TestSumTree(unittest.TestCase):
+    def test_update_and_total(self):
+        tree = SumTree(capacity=100)
+        priorities = np.random.uniform(0, 10, size=100)
+        for i, priority in enumerate(priorities):
+            tree.update(i, priority)
+        self.assertAlmostEqual(tree.total(), np.sum(priorities))
+
+        # overwrite some leaves
+        for i in range(0, 100, 7):
+            priorities[i] = 0.5
+            tree.update(i, 0.5)
+        self.assertAlmostEqual(tree.total(), np.sum(priorities))
+        self.assertAlmostEqual(tree.get_leaf_value(7), priorities[7])
+
+    def test_retrieve(self):
+        tree = SumTree(capacity=10, branch_factor=4)
+        priorities = [1.0, 0.0, 2.0, 0.5, 0.0, 3.0, 1.5, 0.0, 0.0, 2.0]
+        for i, priority in enumerate(priorities):
+            tree.update(i, priority)
+
+        cumsum = np.cumsum(priorities)
+        for _ in range(1000):
+            prefixsum = np.random.uniform(0, tree.total())
+            leaf_idx = tree.retrieve(prefixsum)
+            expected = int(np.searchsorted(cumsum, prefixsum, side='right'))
+            self.assertEqual(leaf_idx, expected)
+
+    def test_retrieve_boundary(self):
+        tree = SumTree(capacity=5)
+        for i in range(5):
+            tree.update(i, 1.0)
+        self.assertEqual(tree.retrieve(0.0), 0)
+        self.assertEqual(tree.retrieve(tree.total()), 4)
+
+    def test_sampling_proportional_to_priority(self):
+        tree = SumTree(capacity=4)
+        priorities = [1.0, 2.0, 3.0, 4.0]
+        for i, priority in enumerate(priorities):
+            tree.update(i, priority)
+
+        counts = np.zeros(4)
+        n_samples = 10000
+        for _ in range(n_samples):
+            leaf_idx = tree.retrieve(np.random.uniform(0, tree.total()))
+            counts[leaf_idx] += 1
+        frequencies = counts / n_samples
+        expected = np.array(priorities) / np.sum(priorities)
+        self.assertTrue(np.allclose(frequencies, expected, atol=0.05))
+
+
+if __name__ == '__main__':
+    unittest.main()